@@ -51,6 +51,10 @@ describe('INPIAdapter', () => {
         {
           username: 'test@example.com',
           password: 'testpassword'
+        },
+        {
+          httpAgent: expect.any(Object),
+          httpsAgent: expect.any(Object)
         }
       );
 
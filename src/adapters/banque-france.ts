@@ -8,16 +8,9 @@ import type {
   EnterpriseDetails, 
   AdapterStatus 
 } from "./index.js";
-
-// interface BanqueFranceFinancialStatement {
-//   year: number;
-//   revenue?: number;
-//   netIncome?: number;
-//   totalAssets?: number;
-//   equity?: number;
-//   debt?: number;
-//   employees?: number;
-// }
+import { keepAliveAgents } from "./http.js";
+import { TTL_BY_KIND, createCacheKey, packFlags, SingleFlight } from "../cache/index.js";
+import { SIREN_PATTERN } from "../utils/index.js";
 
 interface BanqueFranceCreditRating {
   rating: string;
@@ -33,11 +26,28 @@ interface BanqueFrancePaymentIncident {
   status: string;
 }
 
+// Map Banque de France ratings to risk levels
+// Ratings typically go from 3++ (excellent) to 9 (payment incidents)
+const RATING_RISK_LEVELS: Readonly<Record<string, string>> = Object.freeze({
+  "3++": "Excellent",
+  "3+": "Very Good",
+  "3": "Good",
+  "4+": "Satisfactory",
+  "4": "Fair",
+  "5+": "Weak",
+  "5": "Poor",
+  "6": "Very Poor",
+  "7": "Major Risk",
+  "8": "Threatened",
+  "9": "Payment Incidents"
+});
+
 export class BanqueFranceAdapter implements BaseAdapter {
   private readonly baseUrl = "https://developer.webstat.banque-france.fr/api";
   private readonly apiKey: string;
   private readonly rateLimiter: AdapterConfig["rateLimiter"];
   private readonly cache: AdapterConfig["cache"];
+  private readonly inflight = new SingleFlight();
 
   constructor(config: AdapterConfig) {
     this.rateLimiter = config.rateLimiter;
@@ -50,7 +60,7 @@ export class BanqueFranceAdapter implements BaseAdapter {
   }
 
   async search(query: string, options: SearchOptions): Promise<SearchResult[]> {
-    const cacheKey = `banque-france:search:${query}:${JSON.stringify(options)}`;
+    const cacheKey = createCacheKey("banque-france", "search", query, options);
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -58,12 +68,16 @@ export class BanqueFranceAdapter implements BaseAdapter {
       return cached as SearchResult[];
     }
 
+    return this.inflight.run(cacheKey, () => this.fetchSearchResults(query, options, cacheKey));
+  }
+
+  private async fetchSearchResults(query: string, options: SearchOptions, cacheKey: string): Promise<SearchResult[]> {
     // Apply rate limiting
     await this.rateLimiter.acquire("banque-france");
 
     try {
       // Check if query is a SIREN number
-      const isSiren = /^\d{9}$/.test(query);
+      const isSiren = SIREN_PATTERN.test(query);
       
       if (!isSiren) {
         // Banque de France primarily works with SIREN numbers
@@ -79,20 +93,24 @@ export class BanqueFranceAdapter implements BaseAdapter {
         },
         params: {
           limit: options.maxResults || 10
-        }
+        },
+        ...keepAliveAgents
       });
 
       const results = this.transformSearchResults(response.data, query);
       
-      // Cache the results for 1 hour
-      await this.cache.set(cacheKey, results, 3600);
+      // Cache the results
+      await this.cache.set(cacheKey, results, TTL_BY_KIND.search);
       
       return results;
     } catch (error) {
       if (axios.isAxiosError(error)) {
         if (error.response?.status === 404) {
-          // Company not found in Banque de France database
-          return [];
+          // Company not found in Banque de France database: remember the miss
+          // briefly so repeated lookups don't keep hitting the API
+          const notFound: SearchResult[] = [];
+          await this.cache.set(cacheKey, notFound, TTL_BY_KIND.notFound);
+          return notFound;
         }
         throw new Error(`Banque de France API error: ${error.response?.data?.message || error.message}`);
       }
@@ -101,7 +119,10 @@ export class BanqueFranceAdapter implements BaseAdapter {
   }
 
   async getDetails(siren: string, options: DetailsOptions): Promise<EnterpriseDetails> {
-    const cacheKey = `banque-france:details:${siren}:${JSON.stringify(options)}`;
+    const cacheKey = createCacheKey(
+      "banque-france", "details", siren,
+      packFlags(options.includeFinancials, options.includeIntellectualProperty)
+    );
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -109,6 +130,10 @@ export class BanqueFranceAdapter implements BaseAdapter {
       return cached as EnterpriseDetails;
     }
 
+    return this.inflight.run(cacheKey, () => this.fetchDetails(siren, options, cacheKey));
+  }
+
+  private async fetchDetails(siren: string, options: DetailsOptions, cacheKey: string): Promise<EnterpriseDetails> {
     // Apply rate limiting
     await this.rateLimiter.acquire("banque-france");
 
@@ -148,8 +173,8 @@ export class BanqueFranceAdapter implements BaseAdapter {
         }
       }
       
-      // Cache the results for 1 hour
-      await this.cache.set(cacheKey, details, 3600);
+      // Cache the results
+      await this.cache.set(cacheKey, details, TTL_BY_KIND.details);
       
       return details;
     } catch (error) {
@@ -167,7 +192,8 @@ export class BanqueFranceAdapter implements BaseAdapter {
         headers: {
           "Authorization": `Bearer ${this.apiKey}`,
           "Accept": "application/json"
-        }
+        },
+        ...keepAliveAgents
       });
 
       return {
@@ -192,7 +218,8 @@ export class BanqueFranceAdapter implements BaseAdapter {
         },
         params: {
           limit: 3 // Get last 3 annual statements
-        }
+        },
+        ...keepAliveAgents
       });
 
       return response.data.bilans || [];
@@ -210,7 +237,8 @@ export class BanqueFranceAdapter implements BaseAdapter {
         headers: {
           "Authorization": `Bearer ${this.apiKey}`,
           "Accept": "application/json"
-        }
+        },
+        ...keepAliveAgents
       });
 
       const data = response.data;
@@ -238,7 +266,8 @@ export class BanqueFranceAdapter implements BaseAdapter {
         headers: {
           "Authorization": `Bearer ${this.apiKey}`,
           "Accept": "application/json"
-        }
+        },
+        ...keepAliveAgents
       });
 
       return response.data.incidents || [];
@@ -287,22 +316,6 @@ export class BanqueFranceAdapter implements BaseAdapter {
   }
 
   private mapRatingToRiskLevel(rating: string): string {
-    // Map Banque de France ratings to risk levels
-    // Ratings typically go from 3++ (excellent) to 9 (payment incidents)
-    const ratingMap: Record<string, string> = {
-      "3++": "Excellent",
-      "3+": "Very Good",
-      "3": "Good",
-      "4+": "Satisfactory",
-      "4": "Fair",
-      "5+": "Weak",
-      "5": "Poor",
-      "6": "Very Poor",
-      "7": "Major Risk",
-      "8": "Threatened",
-      "9": "Payment Incidents"
-    };
-    
-    return ratingMap[rating] || "Unknown";
+    return RATING_RISK_LEVELS[rating] || "Unknown";
   }
 }
\ No newline at end of file
@@ -0,0 +1,23 @@
+import http from "http";
+import https from "https";
+
+/**
+ * Keep-alive agents shared by every adapter so that upstream calls reuse
+ * pooled sockets (and TLS sessions) instead of handshaking per request.
+ */
+export const httpAgent = new http.Agent({
+  keepAlive: true,
+  maxSockets: 64,
+  maxFreeSockets: 32
+});
+
+export const httpsAgent = new https.Agent({
+  keepAlive: true,
+  maxSockets: 64,
+  maxFreeSockets: 32
+});
+
+/**
+ * Axios request options wiring in the shared agents
+ */
+export const keepAliveAgents = { httpAgent, httpsAgent };
@@ -8,6 +8,9 @@ import type {
   EnterpriseDetails, 
   AdapterStatus 
 } from "./index.js";
+import { keepAliveAgents } from "./http.js";
+import { TTL_BY_KIND, createCacheKey, packFlags, SingleFlight } from "../cache/index.js";
+import { SIREN_PATTERN } from "../utils/index.js";
 
 interface INPIAuthResponse {
   token: string;
@@ -67,9 +70,10 @@ export class INPIAdapter implements BaseAdapter {
   private readonly password: string;
   private readonly rateLimiter: AdapterConfig["rateLimiter"];
   private readonly cache: AdapterConfig["cache"];
+  private readonly inflight = new SingleFlight();
   private axiosInstance: AxiosInstance;
   private authToken?: string;
-  private tokenExpiry?: Date;
+  private tokenExpiresAt = 0; // epoch ms
 
   constructor(config: AdapterConfig) {
     this.rateLimiter = config.rateLimiter;
@@ -88,13 +92,14 @@ export class INPIAdapter implements BaseAdapter {
       headers: {
         "Accept": "application/json",
         "Content-Type": "application/json"
-      }
+      },
+      ...keepAliveAgents
     });
   }
 
   private async authenticate(): Promise<void> {
     // Check if we have a valid token
-    if (this.authToken && this.tokenExpiry && new Date() < this.tokenExpiry) {
+    if (this.authToken && Date.now() < this.tokenExpiresAt) {
       return;
     }
 
@@ -103,10 +108,10 @@ export class INPIAdapter implements BaseAdapter {
     
     if (cachedAuth) {
       const { token, expiry } = cachedAuth as { token: string; expiry: string };
-      const expiryDate = new Date(expiry);
-      if (new Date() < expiryDate) {
+      const expiresAt = Date.parse(expiry);
+      if (Date.now() < expiresAt) {
         this.authToken = token;
-        this.tokenExpiry = expiryDate;
+        this.tokenExpiresAt = expiresAt;
         return;
       }
     }
@@ -117,7 +122,8 @@ export class INPIAdapter implements BaseAdapter {
         {
           username: this.username,
           password: this.password
-        }
+        },
+        { ...keepAliveAgents }
       );
 
       this.authToken = response.data.token;
@@ -126,12 +132,12 @@ export class INPIAdapter implements BaseAdapter {
       const expiresIn = 86400; // 24 hours as per INPI JWT
       const safetyMargin = Math.min(300, expiresIn / 2); // Use 5 min or half the duration
       
-      this.tokenExpiry = new Date(Date.now() + (expiresIn - safetyMargin) * 1000);
+      this.tokenExpiresAt = Date.now() + (expiresIn - safetyMargin) * 1000;
 
       // Cache the token
       await this.cache.set(cacheKey, {
         token: this.authToken,
-        expiry: this.tokenExpiry.toISOString()
+        expiry: new Date(this.tokenExpiresAt).toISOString()
       }, expiresIn - safetyMargin);
 
     } catch (error) {
@@ -163,7 +169,7 @@ export class INPIAdapter implements BaseAdapter {
   }
 
   async search(query: string, options: SearchOptions): Promise<SearchResult[]> {
-    const cacheKey = `inpi:search:${query}:${JSON.stringify(options)}`;
+    const cacheKey = createCacheKey("inpi", "search", query, options);
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -171,12 +177,16 @@ export class INPIAdapter implements BaseAdapter {
       return cached as SearchResult[];
     }
 
+    return this.inflight.run(cacheKey, () => this.fetchSearchResults(query, options, cacheKey));
+  }
+
+  private async fetchSearchResults(query: string, options: SearchOptions, cacheKey: string): Promise<SearchResult[]> {
     // Apply rate limiting
     await this.rateLimiter.acquire("inpi");
 
     try {
       // Check if query is a SIREN number
-      const isSiren = /^\d{9}$/.test(query);
+      const isSiren = SIREN_PATTERN.test(query);
       
       let companies: INPICompany[] = [];
       
@@ -215,7 +225,7 @@ export class INPIAdapter implements BaseAdapter {
       const results = companies.map(company => this.transformToSearchResult(company));
       
       // Cache the results
-      await this.cache.set(cacheKey, results, 3600); // Cache for 1 hour
+      await this.cache.set(cacheKey, results, TTL_BY_KIND.search);
       
       return results;
     } catch (error) {
@@ -230,7 +240,10 @@ export class INPIAdapter implements BaseAdapter {
   }
 
   async getDetails(siren: string, options: DetailsOptions): Promise<EnterpriseDetails> {
-    const cacheKey = `inpi:details:${siren}:${JSON.stringify(options)}`;
+    const cacheKey = createCacheKey(
+      "inpi", "details", siren,
+      packFlags(options.includeFinancials, options.includeIntellectualProperty)
+    );
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -238,34 +251,46 @@ export class INPIAdapter implements BaseAdapter {
       return cached as EnterpriseDetails;
     }
 
+    return this.inflight.run(cacheKey, () => this.fetchDetails(siren, options, cacheKey));
+  }
+
+  private async fetchDetails(siren: string, options: DetailsOptions, cacheKey: string): Promise<EnterpriseDetails> {
     // Apply rate limiting
     await this.rateLimiter.acquire("inpi");
 
     try {
+      // Authenticate once up front so the parallel requests below share the token
+      await this.authenticate();
+
       // Get company details
-      const company = await this.makeAuthenticatedRequest<INPICompany>(
+      const companyRequest = this.makeAuthenticatedRequest<INPICompany>(
         `/companies/${siren}`
       );
 
-      let intellectualProperty = undefined;
-      
-      if (options.includeIntellectualProperty) {
-        // Get attachments to count intellectual property documents
-        try {
-          const attachments = await this.makeAuthenticatedRequest<{ attachments: INPIAttachment[] }>(
+      // Get attachments to count intellectual property documents, alongside
+      // the company details; a failure here must not fail the whole lookup.
+      // Note this request is issued even when the company lookup then fails
+      // (e.g. 404), trading one extra INPI call for lower latency on hits.
+      const intellectualPropertyRequest = options.includeIntellectualProperty
+        ? this.makeAuthenticatedRequest<{ attachments: INPIAttachment[] }>(
             `/companies/${siren}/attachments`
-          );
-          
-          intellectualProperty = this.countIntellectualProperty(attachments.attachments || []);
-        } catch (error) {
-          console.warn(`Failed to fetch attachments for ${siren}:`, error);
-        }
-      }
+          )
+            .then(attachments => this.countIntellectualProperty(attachments?.attachments || []))
+            .catch(error => {
+              console.warn(`Failed to fetch attachments for ${siren}:`, error);
+              return undefined;
+            })
+        : undefined;
+
+      const [company, intellectualProperty] = await Promise.all([
+        companyRequest,
+        intellectualPropertyRequest
+      ]);
 
       const details = this.transformToEnterpriseDetails(company, intellectualProperty);
       
       // Cache the results
-      await this.cache.set(cacheKey, details, 3600); // Cache for 1 hour
+      await this.cache.set(cacheKey, details, TTL_BY_KIND.details);
       
       return details;
     } catch (error) {
@@ -397,16 +422,6 @@ export class INPIAdapter implements BaseAdapter {
     };
   }
 
-  private formatAddress(company: INPICompany): string {
-    const parts = [
-      company.adresse,
-      company.codePostal,
-      company.ville
-    ].filter(Boolean);
-    
-    return parts.join(" ");
-  }
-
   private formatAddressFromINPI(adresseEntreprise: any, personneMorale: any, company: any): string {
     // Try to extract address from the nested INPI structure
     
@@ -431,16 +446,6 @@ export class INPIAdapter implements BaseAdapter {
     return "";
   }
 
-  private determineStatus(company: INPICompany): string {
-    if (company.dateRadiation) {
-      return "radié";
-    }
-    if (company.statut) {
-      return company.statut.toLowerCase();
-    }
-    return "actif";
-  }
-
   private determineINPIStatus(company: any): string {
     // Handle actual INPI response structure
     const formality = company.formality || {};
@@ -494,7 +499,7 @@ export class INPIAdapter implements BaseAdapter {
     isCompany: boolean;
     companySiren?: string;
   }>> {
-    const cacheKey = `inpi:beneficial-owners:${siren}`;
+    const cacheKey = createCacheKey("inpi", "beneficial-owners", siren);
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -519,7 +524,7 @@ export class INPIAdapter implements BaseAdapter {
       }));
 
       // Cache the results
-      await this.cache.set(cacheKey, beneficialOwners, 3600); // Cache for 1 hour
+      await this.cache.set(cacheKey, beneficialOwners, TTL_BY_KIND.beneficialOwners);
 
       return beneficialOwners;
     } catch (error) {
@@ -546,7 +551,7 @@ export class INPIAdapter implements BaseAdapter {
     confidential: boolean;
     downloadUrl?: string;
   }>> {
-    const cacheKey = `inpi:publications:${siren}:${JSON.stringify(options || {})}`;
+    const cacheKey = createCacheKey("inpi", "publications", siren, options || {});
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -562,43 +567,43 @@ export class INPIAdapter implements BaseAdapter {
         `/companies/${siren}/attachments`
       );
 
-      let publications = (attachments.attachments || [])
+      // Parse each deposit date once and compare against the bounds as epoch millis
+      const fromTime = options?.from ? options.from.getTime() : -Infinity;
+      const toTime = options?.to ? options.to.getTime() : Infinity;
+
+      // Resolve the type and confidentiality options once, outside the filter
+      const wantedType = options?.type && options.type !== 'ALL' ? options.type : undefined;
+      const includeConfidential = !!options?.includeConfidential;
+
+      const dated = (attachments.attachments || [])
         .filter(att => {
           // Filter by type if specified
-          if (options?.type && options.type !== 'ALL' && att.type !== options.type) {
+          if (wantedType && att.type !== wantedType) {
             return false;
           }
           
           // Filter by confidentiality
-          if (!options?.includeConfidential && att.confidentiel) {
-            return false;
-          }
-
-          // Filter by date range
-          const attDate = new Date(att.dateDepot);
-          if (options?.from && attDate < options.from) {
-            return false;
-          }
-          if (options?.to && attDate > options.to) {
-            return false;
-          }
-
-          return true;
+          return includeConfidential || !att.confidentiel;
         })
-        .map(att => ({
-          id: att.id,
-          type: att.type,
-          name: att.nomDocument || `${att.type} ${att.id}`,
-          date: att.dateDepot,
-          confidential: att.confidentiel,
-          downloadUrl: att.confidentiel ? undefined : `${this.baseUrl}${att.url}`
-        }));
+        // Only attachments that passed the cheap checks get their date parsed
+        .map(att => ({ att, time: Date.parse(att.dateDepot) }))
+        // Filter by date range (unparsable dates are kept, as before)
+        .filter(({ time }) => !(time < fromTime || time > toTime));
 
       // Sort by date descending
-      publications.sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime());
+      dated.sort((a, b) => b.time - a.time);
+
+      const publications = dated.map(({ att }) => ({
+        id: att.id,
+        type: att.type,
+        name: att.nomDocument || `${att.type} ${att.id}`,
+        date: att.dateDepot,
+        confidential: att.confidentiel,
+        downloadUrl: att.confidentiel ? undefined : `${this.baseUrl}${att.url}`
+      }));
 
       // Cache the results
-      await this.cache.set(cacheKey, publications, 3600); // Cache for 1 hour
+      await this.cache.set(cacheKey, publications, TTL_BY_KIND.publications);
 
       return publications;
     } catch (error) {
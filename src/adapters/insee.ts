@@ -8,6 +8,9 @@ import type {
   EnterpriseDetails, 
   AdapterStatus 
 } from "./index.js";
+import { keepAliveAgents } from "./http.js";
+import { TTL_BY_KIND, createCacheKey, packFlags, SingleFlight } from "../cache/index.js";
+import { SIREN_PATTERN, SIRET_PATTERN } from "../utils/index.js";
 
 interface INSEETokenResponse {
   access_token: string;
@@ -29,10 +32,11 @@ export class INSEEAdapter implements BaseAdapter {
   
   // Token management
   private accessToken: string | null = null;
-  private tokenExpiry: Date | null = null;
+  private tokenExpiresAt = 0; // epoch ms
   
   private readonly rateLimiter: AdapterConfig["rateLimiter"];
   private readonly cache: AdapterConfig["cache"];
+  private readonly inflight = new SingleFlight();
   private readonly useNewApi: boolean;
 
   constructor(config: AdapterConfig) {
@@ -58,7 +62,7 @@ export class INSEEAdapter implements BaseAdapter {
   }
 
   async search(query: string, options: SearchOptions): Promise<SearchResult[]> {
-    const cacheKey = `insee:search:${query}:${JSON.stringify(options)}`;
+    const cacheKey = createCacheKey("insee", "search", query, options);
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -66,6 +70,10 @@ export class INSEEAdapter implements BaseAdapter {
       return cached as SearchResult[];
     }
 
+    return this.inflight.run(cacheKey, () => this.fetchSearchResults(query, options, cacheKey));
+  }
+
+  private async fetchSearchResults(query: string, options: SearchOptions, cacheKey: string): Promise<SearchResult[]> {
     // Apply rate limiting
     await this.rateLimiter.acquire("insee");
 
@@ -75,8 +83,8 @@ export class INSEEAdapter implements BaseAdapter {
       const baseUrl = this.useNewApi ? this.newBaseUrl : this.legacyBaseUrl;
       
       // Check if query is a SIREN/SIRET number
-      const isSiren = /^\d{9}$/.test(query);
-      const isSiret = /^\d{14}$/.test(query);
+      const isSiren = SIREN_PATTERN.test(query);
+      const isSiret = SIRET_PATTERN.test(query);
       
       let endpoint: string;
       let params: Record<string, any> = {};
@@ -106,7 +114,8 @@ export class INSEEAdapter implements BaseAdapter {
           ...headers,
           "Accept": "application/json"
         },
-        params
+        params,
+        ...keepAliveAgents
       });
 
       let results = this.transformSearchResults(response.data);
@@ -139,7 +148,7 @@ export class INSEEAdapter implements BaseAdapter {
       }
       
       // Cache the results
-      await this.cache.set(cacheKey, results, 3600); // Cache for 1 hour
+      await this.cache.set(cacheKey, results, TTL_BY_KIND.search);
       
       return results;
     } catch (error) {
@@ -158,7 +167,10 @@ export class INSEEAdapter implements BaseAdapter {
   }
 
   async getDetails(siren: string, options: DetailsOptions): Promise<EnterpriseDetails> {
-    const cacheKey = `insee:details:${siren}:${JSON.stringify(options)}`;
+    const cacheKey = createCacheKey(
+      "insee", "details", siren,
+      packFlags(options.includeFinancials, options.includeIntellectualProperty)
+    );
     
     // Check cache first
     const cached = await this.cache.get(cacheKey);
@@ -166,6 +178,10 @@ export class INSEEAdapter implements BaseAdapter {
       return cached as EnterpriseDetails;
     }
 
+    return this.inflight.run(cacheKey, () => this.fetchDetails(siren, options, cacheKey));
+  }
+
+  private async fetchDetails(siren: string, options: DetailsOptions, cacheKey: string): Promise<EnterpriseDetails> {
     // Apply rate limiting
     await this.rateLimiter.acquire("insee");
 
@@ -177,13 +193,14 @@ export class INSEEAdapter implements BaseAdapter {
         headers: {
           ...headers,
           "Accept": "application/json"
-        }
+        },
+        ...keepAliveAgents
       });
 
       const details = this.transformEnterpriseDetails(response.data);
       
       // Cache the results
-      await this.cache.set(cacheKey, details, 3600); // Cache for 1 hour
+      await this.cache.set(cacheKey, details, TTL_BY_KIND.details);
       
       return details;
     } catch (error) {
@@ -204,7 +221,8 @@ export class INSEEAdapter implements BaseAdapter {
         headers: {
           ...headers,
           "Accept": "application/json"
-        }
+        },
+        ...keepAliveAgents
       });
 
       return {
@@ -250,7 +268,7 @@ export class INSEEAdapter implements BaseAdapter {
    */
   private async getAccessToken(): Promise<string> {
     // Check if we have a valid token
-    if (this.accessToken && this.tokenExpiry && new Date() < this.tokenExpiry) {
+    if (this.accessToken && Date.now() < this.tokenExpiresAt) {
       return this.accessToken;
     }
 
@@ -264,7 +282,8 @@ export class INSEEAdapter implements BaseAdapter {
           headers: {
             "Authorization": `Basic ${credentials}`,
             "Content-Type": "application/x-www-form-urlencoded"
-          }
+          },
+          ...keepAliveAgents
         }
       );
 
@@ -272,7 +291,7 @@ export class INSEEAdapter implements BaseAdapter {
       this.accessToken = tokenData.access_token;
       
       // Set expiry time (subtract 5 minutes for safety)
-      this.tokenExpiry = new Date(Date.now() + (tokenData.expires_in - 300) * 1000);
+      this.tokenExpiresAt = Date.now() + (tokenData.expires_in - 300) * 1000;
       
       return this.accessToken;
     } catch (error) {
@@ -16,6 +16,23 @@ export interface CacheStats {
   vsize: number;
 }
 
+/**
+ * Cache TTLs in seconds, per kind of cached data. Keys follow the
+ * "<source>:<kind>:<id>[:<options>]" schema built by createCacheKey;
+ * process-wide entries such as the "api:status" snapshot omit the id.
+ *
+ * Not to be confused with the CACHE_TTL environment variable, which the
+ * server does not read.
+ */
+export const TTL_BY_KIND = Object.freeze({
+  search: 3600,            // Search results: 1 hour
+  details: 3600,           // Registry and Banque de France details (incl. ratings, incidents): 1 hour
+  beneficialOwners: 86400, // INPI representatives: 1 day
+  publications: 3600,      // INPI filings: 1 hour
+  notFound: 300,           // Negative results: 5 minutes
+  status: 10               // API health snapshot: 10 seconds
+});
+
 export class MemoryCache implements Cache {
   private cache: NodeCache;
 
@@ -60,6 +77,70 @@ export class MemoryCache implements Cache {
   }
 }
 
+/**
+ * Packs boolean options into a single hex digit for compact cache keys.
+ * The first flag is the most significant bit; missing flags count as false.
+ */
+export function packFlags(...flags: Array<boolean | undefined>): string {
+  let bits = 0;
+  for (const flag of flags) {
+    bits = (bits << 1) | (flag ? 1 : 0);
+  }
+  return bits.toString(16);
+}
+
+/**
+ * Coalesces concurrent calls that share a key: the first caller runs the
+ * work and every caller arriving before it settles awaits the same promise.
+ * Used in front of upstream fetches to avoid cache-miss stampedes.
+ */
+export class SingleFlight {
+  private inflight = new Map<string, Promise<unknown>>();
+
+  run<T>(key: string, fn: () => Promise<T>): Promise<T> {
+    const pending = this.inflight.get(key);
+    if (pending) {
+      return pending as Promise<T>;
+    }
+
+    const promise = fn().finally(() => {
+      this.inflight.delete(key);
+    });
+    this.inflight.set(key, promise);
+    return promise;
+  }
+}
+
 export function createCache(options?: NodeCache.Options): Cache {
   return new MemoryCache(options);
-}
\ No newline at end of file
+}
+
+/**
+ * JSON.stringify replacer that emits plain-object keys in sorted order
+ */
+function sortKeys(_key: string, value: unknown): unknown {
+  if (value === null || typeof value !== "object" || Array.isArray(value)) {
+    return value;
+  }
+
+  const keys = Object.keys(value);
+  if (keys.length < 2) {
+    return value;
+  }
+
+  const sorted: Record<string, unknown> = {};
+  for (const key of keys.sort()) {
+    sorted[key] = (value as Record<string, unknown>)[key];
+  }
+  return sorted;
+}
+
+/**
+ * Builds a cache key from its parts. Non-string parts are serialized with
+ * sorted object keys so that equivalent options always map to the same entry.
+ */
+export function createCacheKey(...parts: unknown[]): string {
+  return parts
+    .map(part => typeof part === "string" ? part : JSON.stringify(part, sortKeys))
+    .join(":");
+}
@@ -7,7 +7,8 @@ import { z } from "zod";
 import dotenv from "dotenv";
 import { setupAdapters } from "./adapters/index.js";
 import { createRateLimiter } from "./rate-limiter/index.js";
-import { createCache } from "./cache/index.js";
+import { TTL_BY_KIND, createCache, createCacheKey } from "./cache/index.js";
+import { SIREN_PATTERN } from "./utils/index.js";
 
 // Load environment variables
 dotenv.config();
@@ -29,6 +30,12 @@ const cache = createCache();
 // Setup adapters for different data sources
 const adapters = setupAdapters({ rateLimiter, cache });
 
+// get_api_status snapshot cache key (no per-id part: one snapshot for all adapters)
+const STATUS_CACHE_KEY = createCacheKey("api", "status");
+
+// Shared SIREN field, validated against the precompiled pattern from utils
+const SirenSchema = z.string().regex(SIREN_PATTERN, "SIREN must be 9 digits");
+
 // Define the schema for enterprise search
 const SearchSchema = z.object({
   query: z.string().describe("Enterprise name or SIREN/SIRET number"),
@@ -39,7 +46,7 @@ const SearchSchema = z.object({
 
 // Define the schema for detailed enterprise info
 const EnterpriseDetailSchema = z.object({
-  siren: z.string().regex(/^\d{9}$/, "SIREN must be 9 digits"),
+  siren: SirenSchema,
   source: z.enum(["all", "insee", "banque-france", "inpi"]).default("all"),
   includeFinancials: z.boolean().default(true),
   includeIntellectualProperty: z.boolean().default(true)
@@ -47,12 +54,12 @@ const EnterpriseDetailSchema = z.object({
 
 // Define the schema for beneficial owners
 const BeneficialOwnersSchema = z.object({
-  siren: z.string().regex(/^\d{9}$/, "SIREN must be 9 digits")
+  siren: SirenSchema
 });
 
 // Define the schema for company publications
 const CompanyPublicationsSchema = z.object({
-  siren: z.string().regex(/^\d{9}$/, "SIREN must be 9 digits"),
+  siren: SirenSchema,
   type: z.enum(["ACTE", "BILAN", "ALL"]).default("ALL"),
   from: z.string().optional().describe("Start date (YYYY-MM-DD)"),
   to: z.string().optional().describe("End date (YYYY-MM-DD)"),
@@ -67,42 +74,43 @@ const DifferentialUpdatesSchema = z.object({
   searchAfter: z.string().optional().describe("Pagination cursor")
 });
 
+// Tool definitions, built once at startup and served as-is on every list_tools call
+const TOOLS = [
+  {
+    name: "search_enterprises",
+    description: "Search for French enterprises across multiple data sources",
+    inputSchema: SearchSchema
+  },
+  {
+    name: "get_enterprise_details", 
+    description: "Get detailed information about a French enterprise by SIREN",
+    inputSchema: EnterpriseDetailSchema
+  },
+  {
+    name: "get_api_status",
+    description: "Check the status and rate limits of connected APIs",
+    inputSchema: z.object({})
+  },
+  {
+    name: "get_beneficial_owners",
+    description: "Get beneficial ownership information for a French enterprise (INPI only)",
+    inputSchema: BeneficialOwnersSchema
+  },
+  {
+    name: "get_company_publications",
+    description: "Get company publications and legal documents (INPI only)",
+    inputSchema: CompanyPublicationsSchema
+  },
+  {
+    name: "get_differential_updates",
+    description: "Get recent company changes and updates (INPI only)",
+    inputSchema: DifferentialUpdatesSchema
+  }
+];
+
 // Register list_tools handler
 server.setRequestHandler(ListToolsRequestSchema, async () => {
-  return {
-    tools: [
-      {
-        name: "search_enterprises",
-        description: "Search for French enterprises across multiple data sources",
-        inputSchema: SearchSchema
-      },
-      {
-        name: "get_enterprise_details", 
-        description: "Get detailed information about a French enterprise by SIREN",
-        inputSchema: EnterpriseDetailSchema
-      },
-      {
-        name: "get_api_status",
-        description: "Check the status and rate limits of connected APIs",
-        inputSchema: z.object({})
-      },
-      {
-        name: "get_beneficial_owners",
-        description: "Get beneficial ownership information for a French enterprise (INPI only)",
-        inputSchema: BeneficialOwnersSchema
-      },
-      {
-        name: "get_company_publications",
-        description: "Get company publications and legal documents (INPI only)",
-        inputSchema: CompanyPublicationsSchema
-      },
-      {
-        name: "get_differential_updates",
-        description: "Get recent company changes and updates (INPI only)",
-        inputSchema: DifferentialUpdatesSchema
-      }
-    ]
-  };
+  return { tools: TOOLS };
 });
 
 // Register call_tool handler
@@ -168,12 +176,11 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         // Fetch from all adapters
         const detailPromises = Object.entries(adapters).map(([name, adapter]) => 
           adapter.getDetails(siren, { includeFinancials, includeIntellectualProperty })
-            .then(data => ({ [name]: data }))
-            .catch(error => ({ [name]: { error: error.message } }))
+            .then(data => [name, data] as const)
+            .catch(error => [name, { error: error.message }] as const)
         );
         
-        const results = await Promise.all(detailPromises);
-        details = Object.assign({}, ...results);
+        details = Object.fromEntries(await Promise.all(detailPromises));
       } else {
         // Fetch from specific adapter
         const adapter = adapters[source];
@@ -212,22 +219,24 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
     
     case "get_api_status": {
     try {
-      const statusPromises = Object.entries(adapters).map(async ([name, adapter]) => {
-        try {
-          const status = await adapter.getStatus();
-          return { [name]: status };
-        } catch (error) {
-          return { 
-            [name]: { 
+      // Health probes hit every upstream API; reuse a recent snapshot when polled repeatedly
+      let status = await cache.get(STATUS_CACHE_KEY);
+      
+      if (!status) {
+        const statusPromises = Object.entries(adapters).map(async ([name, adapter]) => {
+          try {
+            return [name, await adapter.getStatus()] as const;
+          } catch (error) {
+            return [name, { 
               available: false, 
               error: error instanceof Error ? error.message : "Unknown error" 
-            } 
-          };
-        }
-      });
-      
-      const results = await Promise.all(statusPromises);
-      const status = Object.assign({}, ...results);
+            }] as const;
+          }
+        });
+        
+        status = Object.fromEntries(await Promise.all(statusPromises));
+        await cache.set(STATUS_CACHE_KEY, status, TTL_BY_KIND.status);
+      }
       
       return {
         content: [{
@@ -22,27 +22,36 @@ export interface RateLimitConfig {
   requestsPerHour?: number;
 }
 
+// Fallback limits for sources without an explicit configuration
+const DEFAULT_LIMIT: Readonly<Required<RateLimitConfig>> = Object.freeze({
+  requestsPerSecond: 10,
+  requestsPerMinute: 100,
+  requestsPerHour: 1000
+});
+
+// Sources with a limiter created up front
+const KNOWN_SOURCES = Object.freeze(["insee", "banque-france", "inpi"]);
+
+interface SourceBucket {
+  limiter: ReturnType<typeof pLimit>;
+  count: number;
+  resetAt: number; // epoch ms
+}
+
 export class TokenBucketRateLimiter implements RateLimiter {
-  private limiters: Map<string, ReturnType<typeof pLimit>>;
-  private counters: Map<string, { count: number; resetTime: Date }>;
+  private buckets: Map<string, SourceBucket>;
   private config: RateLimiterConfig;
 
   constructor(config?: RateLimiterConfig) {
     this.config = config || {};
-    this.limiters = new Map();
-    this.counters = new Map();
+    this.buckets = new Map();
     
     // Initialize limiters for known sources
-    const sources = ["insee", "banque-france", "inpi"];
-    sources.forEach(source => this.initializeLimiter(source));
+    KNOWN_SOURCES.forEach(source => this.initializeLimiter(source));
   }
 
-  private initializeLimiter(source: string): void {
-    const config = this.config.limits?.[source] || this.config.defaultLimit || {
-      requestsPerSecond: 10,
-      requestsPerMinute: 100,
-      requestsPerHour: 1000
-    };
+  private initializeLimiter(source: string): SourceBucket {
+    const config = this.config.limits?.[source] || this.config.defaultLimit || DEFAULT_LIMIT;
     
     // Use the most restrictive limit
     const limit = Math.min(
@@ -51,62 +60,59 @@ export class TokenBucketRateLimiter implements RateLimiter {
       (config.requestsPerHour || Infinity) / 3600
     );
     
-    this.limiters.set(source, pLimit(Math.max(1, Math.floor(limit))));
-    this.counters.set(source, {
+    const bucket: SourceBucket = {
+      limiter: pLimit(Math.max(1, Math.floor(limit))),
       count: 0,
-      resetTime: new Date(Date.now() + 3600000) // Reset in 1 hour
-    });
+      resetAt: Date.now() + 3600000 // Reset in 1 hour
+    };
+    this.buckets.set(source, bucket);
+    return bucket;
   }
 
   async acquire(source: string): Promise<void> {
-    if (!this.limiters.has(source)) {
-      this.initializeLimiter(source);
-    }
-    
-    const limiter = this.limiters.get(source)!;
-    const counter = this.counters.get(source)!;
+    // Single map probe on the hot path; unknown sources are created on first use
+    const bucket = this.buckets.get(source) ?? this.initializeLimiter(source);
     
-    // Check if we need to reset the counter
-    if (new Date() > counter.resetTime) {
-      counter.count = 0;
-      counter.resetTime = new Date(Date.now() + 3600000);
+    // Check if we need to reset the counter (plain number compare, no Date allocation)
+    const now = Date.now();
+    if (now > bucket.resetAt) {
+      bucket.count = 0;
+      bucket.resetAt = now + 3600000;
     }
     
     // Acquire a slot
-    await limiter(async () => {
-      counter.count++;
+    await bucket.limiter(async () => {
+      bucket.count++;
       // Small delay to respect rate limits
       await new Promise(resolve => setTimeout(resolve, 100));
     });
   }
 
   async getStatus(source: string): Promise<RateLimitStatus> {
-    const counter = this.counters.get(source);
-    if (!counter) {
+    const bucket = this.buckets.get(source);
+    if (!bucket) {
       return {
         remaining: 0,
         reset: new Date()
       };
     }
     
-    const config = this.config.limits?.[source] || this.config.defaultLimit || {
-      requestsPerHour: 1000
-    };
+    const config = this.config.limits?.[source] || this.config.defaultLimit || DEFAULT_LIMIT;
     
-    const limit = config.requestsPerHour || 1000;
-    const remaining = Math.max(0, limit - counter.count);
+    const limit = config.requestsPerHour || DEFAULT_LIMIT.requestsPerHour;
+    const remaining = Math.max(0, limit - bucket.count);
     
     return {
       remaining,
-      reset: counter.resetTime
+      reset: new Date(bucket.resetAt)
     };
   }
 
   reset(source: string): void {
-    const counter = this.counters.get(source);
-    if (counter) {
-      counter.count = 0;
-      counter.resetTime = new Date(Date.now() + 3600000);
+    const bucket = this.buckets.get(source);
+    if (bucket) {
+      bucket.count = 0;
+      bucket.resetAt = Date.now() + 3600000;
     }
   }
 }
@@ -130,10 +136,6 @@ export function createRateLimiter(config?: RateLimiterConfig): RateLimiter {
         requestsPerHour: 2000
       }
     },
-    defaultLimit: {
-      requestsPerSecond: 10,
-      requestsPerMinute: 100,
-      requestsPerHour: 1000
-    }
+    defaultLimit: DEFAULT_LIMIT
   });
 }
\ No newline at end of file
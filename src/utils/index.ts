@@ -2,6 +2,14 @@
  * Utility functions for SIREN/SIRET validation and data formatting
  */
 
+const WHITESPACE_PATTERN = /\s/g;
+
+/**
+ * Exact-match patterns for bare SIREN (9 digits) and SIRET (14 digits) strings
+ */
+export const SIREN_PATTERN = /^\d{9}$/;
+export const SIRET_PATTERN = /^\d{14}$/;
+
 /**
  * Validates a SIREN number (9 digits)
  */
@@ -11,8 +19,7 @@ export function validateSIREN(siren: string): boolean {
   }
   
   // Remove spaces and check if it's exactly 9 digits
-  const cleanSiren = siren.replace(/\s/g, '');
-  return /^\d{9}$/.test(cleanSiren);
+  return SIREN_PATTERN.test(siren.replace(WHITESPACE_PATTERN, ''));
 }
 
 /**
@@ -23,15 +30,9 @@ export function validateSIRET(siret: string): boolean {
     return false;
   }
   
-  // Remove spaces and check if it's exactly 14 digits
-  const cleanSiret = siret.replace(/\s/g, '');
-  if (!/^\d{14}$/.test(cleanSiret)) {
-    return false;
-  }
-  
-  // Check if the first 9 digits form a valid SIREN
-  const siren = cleanSiret.substring(0, 9);
-  return validateSIREN(siren);
+  // Remove spaces and check if it's exactly 14 digits; a 14-digit SIRET
+  // always starts with a 9-digit SIREN, so no second pass is needed
+  return SIRET_PATTERN.test(siret.replace(WHITESPACE_PATTERN, ''));
 }
 
 /**
@@ -1,4 +1,5 @@
 import { BanqueFranceAdapter } from '../../src/adapters/banque-france';
+import { TTL_BY_KIND } from '../../src/cache';
 import axios from 'axios';
 import { 
   mockCompanies, 
@@ -121,6 +122,27 @@ describe('BanqueFranceAdapter', () => {
       expect(results).toEqual([]);
     });
 
+    it('should briefly cache not-found results', async () => {
+      // jest.mock('axios') stubs isAxiosError to undefined; restore the real check
+      mockedAxios.isAxiosError.mockImplementationOnce(((e: any) => !!e?.isAxiosError) as any);
+      mockedAxios.get.mockRejectedValueOnce({
+        isAxiosError: true,
+        response: { status: 404 }
+      });
+
+      await adapter.search('999999999', searchOptions);
+      const results = await adapter.search('999999999', searchOptions);
+
+      expect(results).toEqual([]);
+      expect(mockedAxios.get).toHaveBeenCalledTimes(1);
+      expect(mockCache.set).toHaveBeenCalledWith(
+        'banque-france:search:999999999:{"maxResults":10}',
+        [],
+        TTL_BY_KIND.notFound
+      );
+      expect(mockCache.set).toHaveBeenCalledTimes(1);
+    });
+
     it('should handle API errors gracefully', async () => {
       mockedAxios.get.mockRejectedValueOnce({
         isAxiosError: true,
@@ -157,6 +179,27 @@ describe('BanqueFranceAdapter', () => {
   describe('getDetails', () => {
     const detailsOptions = { includeFinancials: true };
 
+    it('should coalesce concurrent detail lookups for the same SIREN', async () => {
+      mockedAxios.get.mockImplementation((url) => {
+        if (url.includes('/bilans/')) {
+          return Promise.resolve({
+            data: { bilans: [{ companyName: mockCompanies.danone.name, year: 2023 }] }
+          });
+        }
+        return Promise.resolve({ data: {} });
+      });
+
+      const [first, second] = await Promise.all([
+        adapter.getDetails(mockCompanies.danone.siren, detailsOptions),
+        adapter.getDetails(mockCompanies.danone.siren, detailsOptions)
+      ]);
+
+      expect(second).toBe(first);
+      expect(mockRateLimiter.acquire).toHaveBeenCalledTimes(1);
+      // One fan-out of three sub-requests, not two
+      expect(mockedAxios.get).toHaveBeenCalledTimes(3);
+    });
+
     it('should get detailed financial information', async () => {
       // Mock financial statements call
       mockedAxios.get.mockImplementation((url) => {
@@ -54,7 +54,9 @@ describe('INPIAdapter', () => {
         headers: {
           Accept: 'application/json',
           'Content-Type': 'application/json'
-        }
+        },
+        httpAgent: expect.any(Object),
+        httpsAgent: expect.any(Object)
       });
     });
 
@@ -95,6 +97,10 @@ describe('INPIAdapter', () => {
         {
           username: 'test-user',
           password: 'test-pass'
+        },
+        {
+          httpAgent: expect.any(Object),
+          httpsAgent: expect.any(Object)
         }
       );
 
@@ -378,6 +384,98 @@ describe('INPIAdapter', () => {
       expect(consoleWarnSpy).toHaveBeenCalled();
       consoleWarnSpy.mockRestore();
     });
+
+    describe('concurrent requests', () => {
+      const siren = mockCompanies.danone.siren;
+
+      beforeEach(() => {
+        mockedAxios.post.mockReset();
+        mockedAxios.post.mockResolvedValue({ data: { token: 'test-token' } });
+      });
+
+      it('should have company and attachments requests in flight together', async () => {
+        let resolveCompany: (value: any) => void = () => {};
+        let resolveAttachments: (value: any) => void = () => {};
+        mockAxiosInstance.get
+          .mockImplementationOnce(() => new Promise(resolve => { resolveCompany = resolve; }))
+          .mockImplementationOnce(() => new Promise(resolve => { resolveAttachments = resolve; }));
+
+        const pending = adapter.getDetails(siren, detailsOptions);
+        // Let authentication and request dispatch settle
+        await new Promise(resolve => setImmediate(resolve));
+
+        // Both requests were issued before either resolved
+        expect(mockAxiosInstance.get).toHaveBeenCalledTimes(2);
+        expect(mockAxiosInstance.get.mock.calls[0][0]).toBe(`/companies/${siren}`);
+        expect(mockAxiosInstance.get.mock.calls[1][0]).toBe(`/companies/${siren}/attachments`);
+
+        resolveAttachments({ data: { attachments: [{ nomDocument: 'Brevet', type: 'ACTE' }] } });
+        resolveCompany({ data: { siren, denomination: mockCompanies.danone.name } });
+
+        const details = await pending;
+        expect(details.basicInfo.siren).toBe(siren);
+        expect(details.intellectualProperty).toEqual({ trademarks: 0, patents: 1, designs: 0 });
+      });
+
+      it('should log in once for both requests', async () => {
+        mockAxiosInstance.get
+          .mockResolvedValueOnce({ data: { siren, denomination: mockCompanies.danone.name } })
+          .mockResolvedValueOnce({ data: { attachments: [] } });
+
+        await adapter.getDetails(siren, detailsOptions);
+
+        expect(mockedAxios.post).toHaveBeenCalledTimes(1);
+        expect(mockedAxios.post).toHaveBeenCalledWith(
+          expect.stringContaining('/sso/login'),
+          expect.any(Object),
+          expect.objectContaining({ httpsAgent: expect.any(Object) })
+        );
+        for (const [, config] of mockAxiosInstance.get.mock.calls) {
+          expect(config.headers.Authorization).toBe('Bearer test-token');
+        }
+      });
+
+      it('should return details when only the attachments request fails', async () => {
+        const consoleWarnSpy = jest.spyOn(console, 'warn').mockImplementation();
+        mockAxiosInstance.get
+          .mockResolvedValueOnce({ data: { siren, denomination: mockCompanies.danone.name } })
+          .mockRejectedValueOnce(new Error('Attachments not available'));
+
+        const details = await adapter.getDetails(siren, detailsOptions);
+
+        expect(details.basicInfo.siren).toBe(siren);
+        expect(details.intellectualProperty).toBeUndefined();
+        expect(consoleWarnSpy).toHaveBeenCalledWith(
+          `Failed to fetch attachments for ${siren}:`,
+          expect.any(Error)
+        );
+        consoleWarnSpy.mockRestore();
+      });
+
+      it('should return details when the attachments response has no body', async () => {
+        mockAxiosInstance.get
+          .mockResolvedValueOnce({ data: { siren, denomination: mockCompanies.danone.name } })
+          .mockResolvedValueOnce({ data: null });
+
+        const details = await adapter.getDetails(siren, detailsOptions);
+
+        expect(details.basicInfo.siren).toBe(siren);
+        expect(details.intellectualProperty).toEqual({ trademarks: 0, patents: 0, designs: 0 });
+      });
+
+      it('should reject the lookup when the company request fails', async () => {
+        mockAxiosInstance.get
+          .mockRejectedValueOnce(new Error('Company not found'))
+          .mockResolvedValueOnce({ data: { attachments: [] } });
+
+        await expect(adapter.getDetails(siren, detailsOptions)).rejects.toThrow('Company not found');
+        expect(mockCache.set).not.toHaveBeenCalledWith(
+          expect.stringContaining('inpi:details:'),
+          expect.anything(),
+          expect.anything()
+        );
+      });
+    });
   });
 
   describe('getStatus', () => {
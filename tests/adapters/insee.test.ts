@@ -174,6 +174,21 @@ describe('INSEEAdapter', () => {
       
       expect(mockedAxios.get).not.toHaveBeenCalled();
     });
+
+    it('should coalesce concurrent identical searches into one upstream call', async () => {
+      mockedAxios.get.mockResolvedValueOnce({
+        data: mockINSEEResponses.searchBySiren
+      });
+
+      const [first, second] = await Promise.all([
+        adapter.search(mockCompanies.danone.siren, searchOptions),
+        adapter.search(mockCompanies.danone.siren, searchOptions)
+      ]);
+
+      expect(mockedAxios.get).toHaveBeenCalledTimes(1);
+      expect(mockRateLimiter.acquire).toHaveBeenCalledTimes(1);
+      expect(second).toBe(first);
+    });
   });
 
   describe('getDetails', () => {
@@ -187,7 +202,7 @@ describe('INSEEAdapter', () => {
       const details = await adapter.getDetails(mockCompanies.danone.siren, detailsOptions);
 
       expect(mockCache.get).toHaveBeenCalledWith(
-        `insee:details:${mockCompanies.danone.siren}:{"includeFinancials":true}`
+        `insee:details:${mockCompanies.danone.siren}:2`
       );
       expect(mockRateLimiter.acquire).toHaveBeenCalledWith('insee');
       expect(mockedAxios.get).toHaveBeenCalledWith(
@@ -212,7 +227,7 @@ describe('INSEEAdapter', () => {
       });
 
       expect(mockCache.set).toHaveBeenCalledWith(
-        `insee:details:${mockCompanies.danone.siren}:{"includeFinancials":true}`,
+        `insee:details:${mockCompanies.danone.siren}:2`,
         details,
         3600
       );
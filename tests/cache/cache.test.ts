@@ -1,4 +1,4 @@
-import { MemoryCache, createCache } from '../../src/cache';
+import { MemoryCache, createCache, createCacheKey, packFlags, SingleFlight, TTL_BY_KIND } from '../../src/cache';
 import NodeCache from 'node-cache';
 
 // Mock NodeCache
@@ -427,4 +427,107 @@ describe('Cache Integration Tests', () => {
       expect(await cache.get(item.key)).toBeUndefined();
     }
   });
-});
\ No newline at end of file
+});
+
+describe('createCacheKey', () => {
+  it('should join string parts with colons', () => {
+    expect(createCacheKey('insee', 'search', 'DANONE')).toBe('insee:search:DANONE');
+  });
+
+  it('should serialize option objects like JSON.stringify', () => {
+    expect(createCacheKey('insee', 'search', 'DANONE', { maxResults: 10 }))
+      .toBe('insee:search:DANONE:{"maxResults":10}');
+    expect(createCacheKey('inpi', 'publications', '552032534', {}))
+      .toBe('inpi:publications:552032534:{}');
+  });
+
+  it('should produce the same key regardless of option key order', () => {
+    const a = createCacheKey('inpi', 'search', 'DANONE', { maxResults: 5, includeHistory: true });
+    const b = createCacheKey('inpi', 'search', 'DANONE', { includeHistory: true, maxResults: 5 });
+
+    expect(a).toBe(b);
+    expect(a).toBe('inpi:search:DANONE:{"includeHistory":true,"maxResults":5}');
+  });
+
+  it('should omit undefined options and serialize dates as ISO strings', () => {
+    const from = new Date('2024-01-01T00:00:00.000Z');
+
+    expect(createCacheKey('inpi', 'publications', '552032534', { type: undefined, from }))
+      .toBe('inpi:publications:552032534:{"from":"2024-01-01T00:00:00.000Z"}');
+  });
+});
+
+describe('TTL_BY_KIND', () => {
+  it('should keep slow-moving data longer than volatile data', () => {
+    expect(TTL_BY_KIND.beneficialOwners).toBeGreaterThan(TTL_BY_KIND.details);
+    expect(TTL_BY_KIND.notFound).toBeLessThan(TTL_BY_KIND.details);
+    expect(TTL_BY_KIND.status).toBeLessThan(TTL_BY_KIND.notFound);
+  });
+
+  it('should be frozen', () => {
+    expect(Object.isFrozen(TTL_BY_KIND)).toBe(true);
+  });
+});
+
+describe('packFlags', () => {
+  it('should pack flags most-significant first into a hex digit', () => {
+    expect(packFlags(true, false)).toBe('2');
+    expect(packFlags(false, true)).toBe('1');
+    expect(packFlags(true, true, true, true)).toBe('f');
+  });
+
+  it('should treat missing flags as false', () => {
+    expect(packFlags(undefined, undefined)).toBe('0');
+    expect(packFlags(true, undefined)).toBe(packFlags(true, false));
+  });
+});
+
+describe('SingleFlight', () => {
+  it('should share one in-flight call between concurrent callers', async () => {
+    const flight = new SingleFlight();
+    let resolve!: (value: string) => void;
+    const work = jest.fn(() => new Promise<string>(r => { resolve = r; }));
+
+    const first = flight.run('key', work);
+    const second = flight.run('key', work);
+    resolve('done');
+
+    await expect(first).resolves.toBe('done');
+    await expect(second).resolves.toBe('done');
+    expect(work).toHaveBeenCalledTimes(1);
+  });
+
+  it('should run again once the previous call has settled', async () => {
+    const flight = new SingleFlight();
+    const work = jest.fn(async () => 'value');
+
+    await flight.run('key', work);
+    await flight.run('key', work);
+
+    expect(work).toHaveBeenCalledTimes(2);
+  });
+
+  it('should propagate failures to every waiter and then release the key', async () => {
+    const flight = new SingleFlight();
+    const failing = jest.fn(async () => { throw new Error('upstream down'); });
+
+    const results = await Promise.allSettled([
+      flight.run('key', failing),
+      flight.run('key', failing)
+    ]);
+
+    expect(results.every(r => r.status === 'rejected')).toBe(true);
+    expect(failing).toHaveBeenCalledTimes(1);
+
+    await expect(flight.run('key', async () => 'recovered')).resolves.toBe('recovered');
+  });
+
+  it('should not coalesce calls with different keys', async () => {
+    const flight = new SingleFlight();
+    const work = jest.fn(async () => 'value');
+
+    await Promise.all([flight.run('a', work), flight.run('b', work)]);
+
+    expect(work).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,96 @@
+import { CallToolRequestSchema } from '@modelcontextprotocol/sdk/types.js';
+
+// Request handlers registered by the server, keyed by request schema
+const mockHandlers = new Map<unknown, (request: any) => Promise<any>>();
+let mockCache: any;
+
+const mockAdapters = {
+  insee: { getStatus: jest.fn() },
+  'banque-france': { getStatus: jest.fn() },
+  inpi: { getStatus: jest.fn() }
+};
+
+jest.mock('@modelcontextprotocol/sdk/server/index.js', () => ({
+  Server: jest.fn().mockImplementation(() => ({
+    setRequestHandler: (schema: unknown, handler: (request: any) => Promise<any>) => {
+      mockHandlers.set(schema, handler);
+    },
+    connect: jest.fn()
+  }))
+}));
+jest.mock('../../src/adapters/index.js', () => ({
+  setupAdapters: jest.fn(() => mockAdapters)
+}));
+jest.mock('../../src/rate-limiter/index.js', () => ({
+  createRateLimiter: jest.fn(() => ({}))
+}));
+jest.mock('../../src/cache/index.js', () => {
+  const actual = jest.requireActual('../../src/cache/index.js');
+  const { createMockCache } = jest.requireActual('../fixtures/index.js');
+  mockCache = createMockCache();
+  return { ...actual, createCache: jest.fn(() => mockCache) };
+});
+
+describe('get_api_status', () => {
+  let callTool: (request: any) => Promise<any>;
+  let statusTtl: number;
+  let now: number;
+  let dateSpy: jest.SpyInstance;
+
+  const getApiStatus = () => callTool({ params: { name: 'get_api_status', arguments: {} } });
+
+  beforeAll(() => {
+    require('../../src/index.js');
+    statusTtl = require('../../src/cache/index.js').TTL_BY_KIND.status;
+    callTool = mockHandlers.get(CallToolRequestSchema)!;
+  });
+
+  beforeEach(async () => {
+    now = Date.now();
+    dateSpy = jest.spyOn(Date, 'now').mockImplementation(() => now);
+    await mockCache.flush();
+
+    for (const adapter of Object.values(mockAdapters)) {
+      adapter.getStatus.mockReset();
+      adapter.getStatus.mockImplementation(async () => ({
+        available: true,
+        lastCheck: new Date(now)
+      }));
+    }
+  });
+
+  afterEach(() => {
+    dateSpy.mockRestore();
+  });
+
+  it('should probe each adapter once for calls within the TTL', async () => {
+    const first = await getApiStatus();
+    now += statusTtl * 1000 - 1;
+    const second = await getApiStatus();
+
+    for (const adapter of Object.values(mockAdapters)) {
+      expect(adapter.getStatus).toHaveBeenCalledTimes(1);
+    }
+    // The second call serves the cached snapshot, including its lastCheck
+    expect(second.content[0].text).toBe(first.content[0].text);
+    expect(JSON.parse(second.content[0].text)).toMatchObject({
+      success: true,
+      status: {
+        insee: { available: true },
+        'banque-france': { available: true },
+        inpi: { available: true }
+      }
+    });
+  });
+
+  it('should probe again once the snapshot expires', async () => {
+    const first = await getApiStatus();
+    now += statusTtl * 1000 + 1;
+    const second = await getApiStatus();
+
+    for (const adapter of Object.values(mockAdapters)) {
+      expect(adapter.getStatus).toHaveBeenCalledTimes(2);
+    }
+    expect(second.content[0].text).not.toBe(first.content[0].text);
+  });
+});
@@ -110,6 +110,18 @@ describe('TokenBucketRateLimiter', () => {
       expect(mockLimiter).toHaveBeenCalled();
     });
 
+    it('should initialize an unknown source only once', async () => {
+      mockedPLimit.mockClear();
+      // Skip the slot body (and its 100ms delay, which fake timers never advance)
+      mockLimiter.mockImplementation(async () => {});
+      
+      await rateLimiter.acquire('new-source');
+      await rateLimiter.acquire('new-source');
+
+      expect(mockedPLimit).toHaveBeenCalledTimes(1);
+      expect(mockLimiter).toHaveBeenCalledTimes(2);
+    });
+
     it('should increment counter on acquire', async () => {
       const status1 = await rateLimiter.getStatus('insee');
       const remaining1 = status1.remaining;